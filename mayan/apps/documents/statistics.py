@@ -1,4 +1,5 @@
 from django.apps import apps
+from django.db.models import Count, Q
 from django.utils import timezone
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
@@ -18,6 +19,45 @@ def get_month_name(month_number):
     return force_text(s=MONTH_NAMES[month_number - 1])
 
 
+def get_total_per_month(queryset, date_field):
+    """
+    Return the running total of the queryset at the end of each month of
+    the current year. All the monthly totals are calculated using a single
+    aggregate query instead of one query per month.
+    """
+    now = timezone.now()
+
+    aggregates = {}
+
+    for month in range(1, now.month + 1):
+        if month == 12:
+            next_month = 1
+            year = now.year + 1
+        else:
+            next_month = month + 1
+            year = now.year
+
+        aggregates['month_{}'.format(month)] = Count(
+            'pk', filter=Q(
+                **{
+                    '{}__lte'.format(date_field): timezone.datetime(
+                        year, next_month, 1, tzinfo=now.tzinfo
+                    )
+                }
+            )
+        )
+
+    totals = queryset.aggregate(**aggregates)
+
+    return [
+        {
+            get_month_name(month_number=month): totals[
+                'month_{}'.format(month)
+            ]
+        } for month in range(1, now.month + 1)
+    ]
+
+
 def new_documents_per_month():
     Document = apps.get_model(app_label='documents', model_name='Document')
 
@@ -123,32 +163,12 @@ def new_document_pages_this_month(user=None):
 def total_document_per_month():
     Document = apps.get_model(app_label='documents', model_name='Document')
 
-    qss = qsstats.QuerySetStats(Document.valid.all(), 'datetime_created')
-    now = timezone.now()
-
-    result = []
-
-    for month in range(1, now.month + 1):
-        next_month = month + 1
-
-        if month == 12:
-            next_month = 1
-            year = now.year + 1
-        else:
-            next_month = month + 1
-            year = now.year
-
-        result.append(
-            {
-                get_month_name(month_number=month): qss.until(
-                    timezone.datetime(year, next_month, 1, tzinfo=now.tzinfo)
-                )
-            }
-        )
-
     return {
         'series': {
-            'Documents': result
+            'Documents': get_total_per_month(
+                queryset=Document.valid.all(),
+                date_field='datetime_created'
+            )
         }
     }
 
@@ -158,34 +178,12 @@ def total_document_file_per_month():
         app_label='documents', model_name='DocumentFile'
     )
 
-    qss = qsstats.QuerySetStats(
-        DocumentFile.valid.all(), 'document__datetime_created'
-    )
-    now = timezone.now()
-
-    result = []
-
-    for month in range(1, now.month + 1):
-        next_month = month + 1
-
-        if month == 12:
-            next_month = 1
-            year = now.year + 1
-        else:
-            next_month = month + 1
-            year = now.year
-
-        result.append(
-            {
-                get_month_name(month_number=month): qss.until(
-                    timezone.datetime(year, next_month, 1, tzinfo=now.tzinfo)
-                )
-            }
-        )
-
     return {
         'series': {
-            'Files': result
+            'Files': get_total_per_month(
+                queryset=DocumentFile.valid.all(),
+                date_field='document__datetime_created'
+            )
         }
     }
 
@@ -195,34 +193,12 @@ def total_document_page_per_month():
         app_label='documents', model_name='DocumentFilePage'
     )
 
-    qss = qsstats.QuerySetStats(
-        DocumentFilePage.valid.all(), 'document_file__document__datetime_created'
-    )
-    now = timezone.now()
-
-    result = []
-
-    for month in range(1, now.month + 1):
-        next_month = month + 1
-
-        if month == 12:
-            next_month = 1
-            year = now.year + 1
-        else:
-            next_month = month + 1
-            year = now.year
-
-        result.append(
-            {
-                get_month_name(month_number=month): qss.until(
-                    timezone.datetime(year, next_month, 1, tzinfo=now.tzinfo)
-                )
-            }
-        )
-
     return {
         'series': {
-            'Pages': result
+            'Pages': get_total_per_month(
+                queryset=DocumentFilePage.valid.all(),
+                date_field='document_file__document__datetime_created'
+            )
         }
     }
 
@@ -1,3 +1,4 @@
+import io
 import os
 
 from django.conf import settings
@@ -108,6 +109,7 @@ class DocumentSearchTestMixin:
 
 
 class DocumentTestMixin:
+    _test_document_content_cache = {}
     auto_create_test_document_type = True
     auto_upload_test_document = True
     test_document_file_filename = TEST_SMALL_DOCUMENT_FILENAME
@@ -134,23 +136,55 @@ class DocumentTestMixin:
             document_type.delete()
         super().tearDown()
 
+    @classmethod
+    def _create_test_document_stub_instance(cls, document_type, label=None):
+        return Document.objects.create(
+            document_type=document_type, label=label or 'document_stub'
+        )
+
+    @classmethod
+    def _create_test_document_type_instance(cls, index, label=None):
+        label = label or '{}_{}'.format(TEST_DOCUMENT_TYPE_LABEL, index)
+
+        return DocumentType.objects.create(label=label)
+
     def _create_test_document_stub(self, document_type=None, label=None):
-        self.test_document_stub = Document.objects.create(
+        self.test_document_stub = self._create_test_document_stub_instance(
             document_type=document_type or self.test_document_type,
-            label=label or 'document_stub'
+            label=label
         )
         self.test_document = self.test_document_stub
         self.test_documents.append(self.test_document)
 
     def _create_test_document_type(self, label=None):
-        total_document_types = len(self.test_document_types)
-        label = label or '{}_{}'.format(
-            TEST_DOCUMENT_TYPE_LABEL, total_document_types
+        self.test_document_type = self._create_test_document_type_instance(
+            index=len(self.test_document_types), label=label
         )
-
-        self.test_document_type = DocumentType.objects.create(label=label)
         self.test_document_types.append(self.test_document_type)
 
+    def _get_test_document_file_object(self):
+        """
+        Return an in memory file object with the content of the test
+        document. The content of each test document path is read from disk
+        only once and shared by all the test cases.
+        """
+        try:
+            content = DocumentTestMixin._test_document_content_cache[
+                self.test_document_path
+            ]
+        except KeyError:
+            with open(file=self.test_document_path, mode='rb') as file_object:
+                content = file_object.read()
+
+            DocumentTestMixin._test_document_content_cache[
+                self.test_document_path
+            ] = content
+
+        file_object = io.BytesIO(initial_bytes=content)
+        # Mimic the name attribute of file objects returned by open().
+        file_object.name = self.test_document_path
+        return file_object
+
     def _calculate_test_document_path(self):
         if not self.test_document_path:
             self.test_document_path = os.path.join(
@@ -173,7 +207,7 @@ class DocumentTestMixin:
 
         document_type = document_type or self.test_document_type
 
-        with open(file=self.test_document_path, mode='rb') as file_object:
+        with self._get_test_document_file_object() as file_object:
             document, document_file = document_type.new_document(
                 file_object=file_object, label=label,
                 language=self.test_document_language, _user=_user
@@ -193,7 +227,7 @@ class DocumentTestMixin:
         if not action:
             action = DOCUMENT_FILE_ACTION_PAGES_NEW
 
-        with open(file=self.test_document_path, mode='rb') as file_object:
+        with self._get_test_document_file_object() as file_object:
             self.test_document_file = self.test_document.file_new(
                 action=action, file_object=file_object, _user=_user
             )
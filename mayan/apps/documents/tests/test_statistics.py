@@ -1,15 +1,70 @@
-from mayan.apps.testing.tests.base import BaseTestCase
+import mock
 
-from ..statistics import namespace
+from django.utils import timezone
 
+from mayan.apps.storage.tests.mixins import InMemoryStorageTestMixin
+
+from ..statistics import (
+    get_month_name, namespace, total_document_per_month
+)
+
+from .base import GenericDocumentTestCase
+
+
+class DocumentStatisticsTestCase(
+    InMemoryStorageTestMixin, GenericDocumentTestCase
+):
+    def _set_test_document_datetime_created(self, document, *args):
+        document._meta.model.objects.filter(pk=document.pk).update(
+            datetime_created=timezone.datetime(*args, tzinfo=timezone.utc)
+        )
 
-class DocumentStatisticsTestCase(BaseTestCase):
     def test_namespace(self):
         for statistic in namespace.statistics:
-            try:
+            with self.subTest(statistic=statistic.slug):
                 statistic.execute()
-            except Exception as exception:
-                self.fail(
-                    'Error executing: {};  {}'.format(statistic, exception)
-                )
-                raise
+
+    def test_total_document_per_month(self):
+        # Created the previous year, counted in every month.
+        self._set_test_document_datetime_created(
+            self.test_document, 2020, 11, 10
+        )
+
+        self._create_test_document_stub()
+        self._set_test_document_datetime_created(
+            self.test_document, 2021, 1, 20
+        )
+
+        for index in range(2):
+            self._create_test_document_stub()
+            self._set_test_document_datetime_created(
+                self.test_document, 2021, 3, 5
+            )
+
+        # Trashed documents are not counted.
+        self._create_test_document_stub()
+        self._set_test_document_datetime_created(
+            self.test_document, 2021, 2, 1
+        )
+        self.test_document.delete()
+
+        # Created after the current date, not counted.
+        self._create_test_document_stub()
+        self._set_test_document_datetime_created(
+            self.test_document, 2021, 5, 2
+        )
+
+        with mock.patch('django.utils.timezone.now') as mock_now:
+            mock_now.return_value = timezone.datetime(
+                2021, 4, 15, tzinfo=timezone.utc
+            )
+            result = total_document_per_month()
+
+        self.assertEqual(
+            list(result['series']['Documents']), [
+                {get_month_name(month_number=1): 2},
+                {get_month_name(month_number=2): 2},
+                {get_month_name(month_number=3): 4},
+                {get_month_name(month_number=4): 4}
+            ]
+        )
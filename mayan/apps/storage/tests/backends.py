@@ -0,0 +1,27 @@
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+
+
+class InMemoryStorage(Storage):
+    """
+    Storage backend that keeps the content of the files in memory. The
+    content is stored at the class level because a new storage instance is
+    created each time a defined storage is accessed. Meant for tests only.
+    """
+    _files = {}
+
+    def _open(self, name, mode='rb'):
+        return ContentFile(content=self._files[name], name=name)
+
+    def _save(self, name, content):
+        self._files[name] = b''.join(content.chunks())
+        return name
+
+    def delete(self, name):
+        self._files.pop(name, None)
+
+    def exists(self, name):
+        return name in self._files
+
+    def size(self, name):
+        return len(self._files[name])
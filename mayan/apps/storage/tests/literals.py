@@ -7,6 +7,8 @@ TEST_DOWNLOAD_FILE_CONTENT_FILE_NAME = 'test content name'
 TEST_CONTENT = 'testcontent'
 TEST_FILE_NAME = 'test_file'
 
+TEST_STORAGE_BACKEND_IN_MEMORY = 'mayan.apps.storage.tests.backends.InMemoryStorage'
+
 # Filenames
 TEST_ARCHIVE_MSG_STRANGE_DATE_FILENAME = 'strangeDate.msg'
 TEST_ARCHIVE_ZIP_SPECIAL_CHARACTERS_FILENAME_MEMBER = 'test_archvive_with_special_characters_filename_member.zip'
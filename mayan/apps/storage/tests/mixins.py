@@ -15,9 +15,11 @@ from ..compressed_files import Archive
 from ..models import DownloadFile
 from ..utils import mkdtemp
 
+from .backends import InMemoryStorage
 from .literals import (
     TEST_COMPRESSED_FILE_CONTENTS, TEST_DOWNLOAD_FILE_CONTENT_FILE_NAME,
-    TEST_FILE_CONTENTS_1, TEST_FILE3_PATH, TEST_FILENAME1, TEST_FILENAME3
+    TEST_FILE_CONTENTS_1, TEST_FILE3_PATH, TEST_FILENAME1, TEST_FILENAME3,
+    TEST_STORAGE_BACKEND_IN_MEMORY
 )
 
 
@@ -118,6 +120,35 @@ class DownloadFileViewTestMixin:
         return self.get(viewname='storage:download_file_list')
 
 
+class InMemoryStorageTestMixin:
+    """
+    Replace the backend of the defined storages listed in
+    in_memory_storage_names with the InMemoryStorage backend for the
+    duration of each test. Defaults to the document files storage.
+    """
+    in_memory_storage_names = (STORAGE_NAME_DOCUMENT_FILES,)
+
+    def setUp(self):
+        for name in self.in_memory_storage_names:
+            defined_storage = DefinedStorage.get(name=name)
+            self.addCleanup(
+                self._restore_in_memory_storage,
+                defined_storage=defined_storage,
+                dotted_path=defined_storage.dotted_path,
+                kwargs=defined_storage.kwargs
+            )
+            defined_storage.dotted_path = TEST_STORAGE_BACKEND_IN_MEMORY
+            defined_storage.kwargs = {}
+
+        self.addCleanup(InMemoryStorage._files.clear)
+
+        super().setUp()
+
+    def _restore_in_memory_storage(self, defined_storage, dotted_path, kwargs):
+        defined_storage.dotted_path = dotted_path
+        defined_storage.kwargs = kwargs
+
+
 class StorageProcessorTestMixin:
     @classmethod
     def setUpClass(cls):
@@ -10,6 +10,7 @@ from mayan.apps.testing.tests.base import BaseTestCase
 from ..backends.compressedstorage import ZipCompressedPassthroughStorage
 from ..backends.encryptedstorage import EncryptedPassthroughStorage
 
+from .backends import InMemoryStorage
 from .literals import TEST_CONTENT, TEST_FILE_NAME
 
 
@@ -129,3 +130,37 @@ class CombinationPassthroughStorageTestCase(BaseTestCase):
             )
         with storage.open(name=TEST_FILE_NAME, mode='r') as file_object:
             self.assertEqual(file_object.read(), TEST_CONTENT)
+
+
+class InMemoryStorageTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(InMemoryStorage._files.clear)
+
+    def test_file_save_and_load(self):
+        storage = InMemoryStorage()
+
+        test_file_name = storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=force_bytes(s=TEST_CONTENT)
+            )
+        )
+
+        self.assertTrue(storage.exists(name=test_file_name))
+        self.assertEqual(storage.size(name=test_file_name), len(TEST_CONTENT))
+
+        # The content is shared by all the instances.
+        with InMemoryStorage().open(name=test_file_name) as file_object:
+            self.assertEqual(file_object.read(), force_bytes(s=TEST_CONTENT))
+
+    def test_file_delete(self):
+        storage = InMemoryStorage()
+
+        test_file_name = storage.save(
+            name=TEST_FILE_NAME, content=ContentFile(
+                content=force_bytes(s=TEST_CONTENT)
+            )
+        )
+        storage.delete(name=test_file_name)
+
+        self.assertFalse(storage.exists(name=test_file_name))
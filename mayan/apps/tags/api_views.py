@@ -72,7 +72,7 @@ class APITagDocumentListView(
     def get_queryset(self):
         return Document.valid.filter(
             pk__in=self.external_object.documents.only('pk')
-        )
+        ).select_related('document_type')
 
 
 class APIDocumentTagAttachView(generics.ObjectActionAPIView):
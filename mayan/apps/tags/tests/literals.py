@@ -2,6 +2,8 @@ TEST_TAG_LABEL = 'test-tag'
 TEST_TAG_LABEL_EDITED = 'test-tag-edited'
 TEST_TAG_COLOR = '#001122'
 TEST_TAG_COLOR_EDITED = '#221100'
+TEST_TAG_COUNT = 5
+TEST_TAG_DOCUMENT_COUNT = 5
 
 TEST_TAG_INDEX_HAS_TAG = 'HAS_TAG'
 TEST_TAG_INDEX_NO_TAG = 'NO_TAG'
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from mayan.apps.documents.tests.literals import TEST_SMALL_DOCUMENT_PATH
 
 from django.db.models import Q
@@ -139,17 +141,65 @@ class TagAPIViewTestMixin:
         return self.get(viewname='rest_api:tag-list')
 
 
+class TagDocumentTestDataMixin:
+    """
+    Create the test document type, document stub and tag once per test
+    case class instead of once per test. The instances are reloaded before
+    each test to discard in memory changes made by previous tests.
+    """
+    auto_create_test_document_type = False
+    auto_upload_test_document = False
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.test_document_type = cls._create_test_document_type_instance(
+            index=0
+        )
+        cls.test_document_stub = cls._create_test_document_stub_instance(
+            document_type=cls.test_document_type
+        )
+        cls.test_document = cls.test_document_stub
+        cls.test_tag = cls._create_test_tag_instance(index=0)
+
+    def setUp(self):
+        super().setUp()
+        self.test_document.refresh_from_db()
+        self.test_tag.refresh_from_db()
+
+        self.test_document_types.append(self.test_document_type)
+        self.test_documents.append(self.test_document)
+        self.test_tags.append(self.test_tag)
+
+
 class TagTestMixin:
     def setUp(self):
         super().setUp()
         self.test_tags = []
 
-    def _create_test_tag(self, add_test_document=False):
-        total_test_labels = len(self.test_tags)
-        label = '{}_{}'.format(TEST_TAG_LABEL, total_test_labels)
+    @contextmanager
+    def assert_tag_count_delta(self, delta):
+        """
+        Assert that the number of tags changes by delta while executing
+        the context block.
+        """
+        tag_count = Tag.objects.count()
+        yield
+        self.assertEqual(Tag.objects.count(), tag_count + delta)
+
+    @classmethod
+    def _create_test_tag_instance(cls, index):
+        return Tag.objects.create(
+            color=TEST_TAG_COLOR, label=cls._get_test_tag_label(index=index)
+        )
+
+    @staticmethod
+    def _get_test_tag_label(index):
+        return '{}_{}'.format(TEST_TAG_LABEL, index)
 
-        self.test_tag = Tag.objects.create(
-            color=TEST_TAG_COLOR, label=label
+    def _create_test_tag(self, add_test_document=False):
+        self.test_tag = self._create_test_tag_instance(
+            index=len(self.test_tags)
         )
 
         self.test_tags.append(self.test_tag)
@@ -157,6 +207,31 @@ class TagTestMixin:
         if add_test_document:
             self.test_tag.documents.add(self.test_document)
 
+    def _create_test_tags(self, count):
+        """
+        Create several test tags using a single insert query. The tag save
+        method is not called and no tag created events are committed, use
+        _create_test_tag when testing events.
+        """
+        total_test_labels = len(self.test_tags)
+        labels = [
+            self._get_test_tag_label(index=total_test_labels + index)
+            for index in range(count)
+        ]
+
+        Tag.objects.bulk_create(
+            objs=[Tag(color=TEST_TAG_COLOR, label=label) for label in labels]
+        )
+
+        # Reload the tags, not all database backends return the primary
+        # keys of bulk created instances.
+        tags = Tag.objects.in_bulk(field_name='label', id_list=labels)
+        self.test_tags.extend([tags[label] for label in labels])
+        self.test_tag = self.test_tags[-1]
+
+    def _test_document_has_tag(self):
+        return self.test_document.tags.filter(pk=self.test_tag.pk).exists()
+
 
 class TagViewTestMixin:
     def _request_test_tag_create_view(self):
@@ -1,10 +1,9 @@
-from django.utils.encoding import force_text
-
 from rest_framework import status
 
 from mayan.apps.documents.permissions import permission_document_view
 from mayan.apps.documents.tests.mixins.document_mixins import DocumentTestMixin
 from mayan.apps.rest_api.tests.base import BaseAPITestCase
+from mayan.apps.testing.tests.mixins import NPlusOneCheckTestCaseMixin
 
 from ..events import (
     event_tag_attached, event_tag_created, event_tag_edited, event_tag_removed
@@ -15,54 +14,55 @@ from ..permissions import (
     permission_tag_edit, permission_tag_remove, permission_tag_view
 )
 
-from .mixins import TagAPIViewTestMixin, TagTestMixin
+from .literals import (
+    TEST_TAG_COUNT, TEST_TAG_DOCUMENT_COUNT, TEST_TAG_LABEL_EDITED
+)
+from .mixins import (
+    TagAPIViewTestMixin, TagDocumentTestDataMixin, TagTestMixin
+)
 
 
-class TagAPIViewTestCase(TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase):
+class TagAPIViewTestCase(
+    NPlusOneCheckTestCaseMixin, TagAPIViewTestMixin, TagTestMixin,
+    BaseAPITestCase
+):
     def test_tag_create_api_view_no_permission(self):
-        tag_count = Tag.objects.count()
-
         self._clear_events()
 
-        response = self._request_test_tag_create_api_view()
+        with self.assert_tag_count_delta(delta=0):
+            response = self._request_test_tag_create_api_view()
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-        self.assertEqual(Tag.objects.count(), tag_count)
-
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
     def test_tag_create_api_view_with_permission(self):
         self.grant_permission(permission=permission_tag_create)
 
-        tag_count = Tag.objects.count()
-
         self._clear_events()
 
-        response = self._request_test_tag_create_api_view()
+        with self.assert_tag_count_delta(delta=1):
+            response = self._request_test_tag_create_api_view()
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        self.assertEqual(Tag.objects.count(), tag_count + 1)
-
         events = self._get_test_events()
         self.assertEqual(events.count(), 1)
 
-        self.assertEqual(events[0].action_object, None)
-        self.assertEqual(events[0].actor, self._test_case_user)
-        self.assertEqual(events[0].target, self.test_tag)
-        self.assertEqual(events[0].verb, event_tag_created.id)
+        event = events[0]
+        self.assertEqual(event.action_object, None)
+        self.assertEqual(event.actor, self._test_case_user)
+        self.assertEqual(event.target, self.test_tag)
+        self.assertEqual(event.verb, event_tag_created.id)
 
     def test_tag_delete_api_view_no_permission(self):
         self._create_test_tag()
 
-        tag_count = Tag.objects.count()
-
         self._clear_events()
 
         response = self._request_test_tag_delete_api_view()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        self.assertEqual(Tag.objects.count(), tag_count)
+        self.assertTrue(Tag.objects.filter(pk=self.test_tag.pk).exists())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -72,14 +72,12 @@ class TagAPIViewTestCase(TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase):
 
         self.grant_access(obj=self.test_tag, permission=permission_tag_delete)
 
-        tag_count = Tag.objects.count()
-
         self._clear_events()
 
         response = self._request_test_tag_delete_api_view()
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
-        self.assertEqual(Tag.objects.count(), tag_count - 1)
+        self.assertFalse(Tag.objects.filter(pk=self.test_tag.pk).exists())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -111,91 +109,63 @@ class TagAPIViewTestCase(TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase):
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
 
-    def test_tag_edit_api_view_via_patch_no_permission(self):
-        self._create_test_tag()
-
-        tag_label = self.test_tag.label
-        tag_color = self.test_tag.color
-
-        self._clear_events()
-
-        response = self._request_test_tag_edit_api_view(verb='patch')
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-
-        self.test_tag.refresh_from_db()
-        self.assertEqual(self.test_tag.label, tag_label)
-        self.assertEqual(self.test_tag.color, tag_color)
-
-        events = self._get_test_events()
-        self.assertEqual(events.count(), 0)
-
-    def test_tag_edit_api_view_via_patch_with_access(self):
-        self._create_test_tag()
+    def test_tag_edit_api_view_no_permission(self):
+        for verb in ('patch', 'put'):
+            with self.subTest(verb=verb):
+                self._create_test_tag()
 
-        self.grant_access(obj=self.test_tag, permission=permission_tag_edit)
+                tag_label = self.test_tag.label
+                tag_color = self.test_tag.color
 
-        tag_label = self.test_tag.label
-        tag_color = self.test_tag.color
+                self._clear_events()
 
-        self._clear_events()
+                response = self._request_test_tag_edit_api_view(verb=verb)
+                self.assertEqual(
+                    response.status_code, status.HTTP_404_NOT_FOUND
+                )
 
-        response = self._request_test_tag_edit_api_view(verb='patch')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.test_tag.refresh_from_db()
+                self.assertEqual(self.test_tag.label, tag_label)
+                self.assertEqual(self.test_tag.color, tag_color)
 
-        self.test_tag.refresh_from_db()
-        self.assertNotEqual(self.test_tag.label, tag_label)
-        self.assertNotEqual(self.test_tag.color, tag_color)
+                events = self._get_test_events()
+                self.assertEqual(events.count(), 0)
 
-        events = self._get_test_events()
-        self.assertEqual(events.count(), 1)
+    def test_tag_edit_api_view_with_access(self):
+        for verb in ('patch', 'put'):
+            with self.subTest(verb=verb):
+                self._create_test_tag()
 
-        self.assertEqual(events[0].action_object, None)
-        self.assertEqual(events[0].actor, self._test_case_user)
-        self.assertEqual(events[0].target, self.test_tag)
-        self.assertEqual(events[0].verb, event_tag_edited.id)
+                self.grant_access(
+                    obj=self.test_tag, permission=permission_tag_edit
+                )
 
-    def test_tag_edit_api_view_via_put_no_permission(self):
-        self._create_test_tag()
-
-        tag_label = self.test_tag.label
-        tag_color = self.test_tag.color
-
-        self._clear_events()
+                tag_label = self.test_tag.label
+                tag_color = self.test_tag.color
 
-        response = self._request_test_tag_edit_api_view(verb='put')
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+                self._clear_events()
 
-        self.test_tag.refresh_from_db()
-        self.assertEqual(self.test_tag.label, tag_label)
-        self.assertEqual(self.test_tag.color, tag_color)
+                # Tag labels are unique, use a different edited label for
+                # each verb.
+                response = self._request_test_tag_edit_api_view(
+                    extra_data={
+                        'label': '{}_{}'.format(TEST_TAG_LABEL_EDITED, verb)
+                    }, verb=verb
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        events = self._get_test_events()
-        self.assertEqual(events.count(), 0)
+                self.test_tag.refresh_from_db()
+                self.assertNotEqual(self.test_tag.label, tag_label)
+                self.assertNotEqual(self.test_tag.color, tag_color)
 
-    def test_tag_edit_api_view_via_put_with_access(self):
-        self._create_test_tag()
+                events = self._get_test_events()
+                self.assertEqual(events.count(), 1)
 
-        self.grant_access(obj=self.test_tag, permission=permission_tag_edit)
-
-        tag_label = self.test_tag.label
-        tag_color = self.test_tag.color
-
-        self._clear_events()
-
-        response = self._request_test_tag_edit_api_view(verb='put')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        self.test_tag.refresh_from_db()
-        self.assertNotEqual(self.test_tag.label, tag_label)
-        self.assertNotEqual(self.test_tag.color, tag_color)
-
-        events = self._get_test_events()
-        self.assertEqual(events.count(), 1)
-
-        self.assertEqual(events[0].action_object, None)
-        self.assertEqual(events[0].actor, self._test_case_user)
-        self.assertEqual(events[0].target, self.test_tag)
-        self.assertEqual(events[0].verb, event_tag_edited.id)
+                event = events[0]
+                self.assertEqual(event.action_object, None)
+                self.assertEqual(event.actor, self._test_case_user)
+                self.assertEqual(event.target, self.test_tag)
+                self.assertEqual(event.verb, event_tag_edited.id)
 
     def test_tag_list_api_view_no_permission(self):
         self._create_test_tag()
@@ -210,18 +180,20 @@ class TagAPIViewTestCase(TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase):
         self.assertEqual(events.count(), 0)
 
     def test_tag_list_api_view_with_access(self):
-        self._create_test_tag()
-        self.grant_access(
-            obj=self.test_tag, permission=permission_tag_view
-        )
+        self._create_test_tags(count=TEST_TAG_COUNT)
+
+        for test_tag in self.test_tags:
+            self.grant_access(obj=test_tag, permission=permission_tag_view)
 
         self._clear_events()
 
-        response = self._request_test_tag_list_api_view()
+        with self.assertNumQueries(5):
+            response = self._request_test_tag_list_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], TEST_TAG_COUNT)
         self.assertEqual(
             response.data['results'][0]['label'],
-            self.test_tag.label
+            self.test_tags[0].label
         )
 
         events = self._get_test_events()
@@ -229,14 +201,9 @@ class TagAPIViewTestCase(TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase):
 
 
 class TagDocumentAPIViewTestCase(
-    DocumentTestMixin, TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase
+    NPlusOneCheckTestCaseMixin, TagDocumentTestDataMixin, DocumentTestMixin,
+    TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase
 ):
-    auto_upload_test_document = False
-
-    def setUp(self):
-        super().setUp()
-        self._create_test_tag()
-        self._create_test_document_stub()
 
     def test_tag_document_list_api_view_no_permission(self):
         self.test_tag.documents.add(self.test_document)
@@ -282,21 +249,31 @@ class TagDocumentAPIViewTestCase(
         self.assertEqual(events.count(), 0)
 
     def test_tag_document_list_api_view_with_full_access(self):
-        self.test_tag.documents.add(self.test_document)
+        for index in range(TEST_TAG_DOCUMENT_COUNT - 1):
+            self._create_test_document_stub()
+
+        for test_document in self.test_documents:
+            self.test_tag.documents.add(test_document)
+            self.grant_access(
+                obj=test_document, permission=permission_document_view
+            )
 
         self.grant_access(obj=self.test_tag, permission=permission_tag_view)
-        self.grant_access(
-            obj=self.test_document, permission=permission_document_view
-        )
 
         self._clear_events()
 
-        response = self._request_test_tag_document_list_api_view()
+        # DocumentSerializer.file_latest and DocumentSerializer.version_active
+        # still execute one query each per document.
+        self._nplusone_check_enable = False
+
+        with self.assertNumQueries(10 + 2 * TEST_TAG_DOCUMENT_COUNT):
+            response = self._request_test_tag_document_list_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], TEST_TAG_DOCUMENT_COUNT)
 
         self.assertEqual(
-            response.data['results'][0]['uuid'],
-            force_text(s=self.test_document.uuid)
+            {result['uuid'] for result in response.data['results']},
+            {str(test_document.uuid) for test_document in self.test_documents}
         )
 
         events = self._get_test_events()
@@ -324,14 +301,9 @@ class TagDocumentAPIViewTestCase(
 
 
 class DocumentTagAPIViewTestCase(
-    DocumentTestMixin, TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase
+    NPlusOneCheckTestCaseMixin, TagDocumentTestDataMixin, DocumentTestMixin,
+    TagAPIViewTestMixin, TagTestMixin, BaseAPITestCase
 ):
-    auto_upload_test_document = False
-
-    def setUp(self):
-        super().setUp()
-        self._create_test_tag()
-        self._create_test_document_stub()
 
     def test_document_attach_tag_api_view_no_permission(self):
         self._clear_events()
@@ -339,7 +311,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_attach_api_view()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        self.assertTrue(self.test_tag not in self.test_document.tags.all())
+        self.assertFalse(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -354,7 +326,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_attach_api_view()
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-        self.assertTrue(self.test_tag not in self.test_document.tags.all())
+        self.assertFalse(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -369,7 +341,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_attach_api_view()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        self.assertTrue(self.test_tag not in self.test_document.tags.all())
+        self.assertFalse(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -387,15 +359,16 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_attach_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertTrue(self.test_tag in self.test_document.tags.all())
+        self.assertTrue(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 1)
 
-        self.assertEqual(events[0].action_object, self.test_tag)
-        self.assertEqual(events[0].actor, self._test_case_user)
-        self.assertEqual(events[0].target, self.test_document)
-        self.assertEqual(events[0].verb, event_tag_attached.id)
+        event = events[0]
+        self.assertEqual(event.action_object, self.test_tag)
+        self.assertEqual(event.actor, self._test_case_user)
+        self.assertEqual(event.target, self.test_document)
+        self.assertEqual(event.verb, event_tag_attached.id)
 
     def test_trashed_document_attach_tag_api_view_with_full_access(self):
         self.grant_access(
@@ -412,7 +385,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_attach_api_view()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        self.assertTrue(self.test_tag not in self.test_document.tags.all())
+        self.assertFalse(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -458,18 +431,25 @@ class DocumentTagAPIViewTestCase(
         self.assertEqual(events.count(), 0)
 
     def test_document_tag_list_api_view_with_full_access(self):
-        self.test_tag.documents.add(self.test_document)
+        self._create_test_tags(count=TEST_TAG_COUNT - 1)
+        self.test_document.tags.add(*self.test_tags)
+
+        for test_tag in self.test_tags:
+            self.grant_access(obj=test_tag, permission=permission_tag_view)
 
         self.grant_access(
             obj=self.test_document, permission=permission_tag_view
         )
-        self.grant_access(obj=self.test_tag, permission=permission_tag_view)
 
         self._clear_events()
 
-        response = self._request_test_document_tag_list_api_view()
+        with self.assertNumQueries(11):
+            response = self._request_test_document_tag_list_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['results'][0]['label'], self.test_tag.label)
+        self.assertEqual(response.data['count'], TEST_TAG_COUNT)
+        self.assertEqual(
+            response.data['results'][0]['label'], self.test_tags[0].label
+        )
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -500,7 +480,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_remove_api_view()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        self.assertTrue(self.test_tag in self.test_document.tags.all())
+        self.assertTrue(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -517,7 +497,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_remove_api_view()
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-        self.assertTrue(self.test_tag in self.test_document.tags.all())
+        self.assertTrue(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -532,7 +512,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_remove_api_view()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        self.assertTrue(self.test_tag in self.test_document.tags.all())
+        self.assertTrue(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
@@ -550,15 +530,16 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_remove_api_view()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.assertFalse(self.test_tag in self.test_document.tags.all())
+        self.assertFalse(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 1)
 
-        self.assertEqual(events[0].action_object, self.test_tag)
-        self.assertEqual(events[0].actor, self._test_case_user)
-        self.assertEqual(events[0].target, self.test_document)
-        self.assertEqual(events[0].verb, event_tag_removed.id)
+        event = events[0]
+        self.assertEqual(event.action_object, self.test_tag)
+        self.assertEqual(event.actor, self._test_case_user)
+        self.assertEqual(event.target, self.test_document)
+        self.assertEqual(event.verb, event_tag_removed.id)
 
     def test_trashed_document_tag_remove_api_view_with_full_access(self):
         self.test_tag.documents.add(self.test_document)
@@ -575,7 +556,7 @@ class DocumentTagAPIViewTestCase(
         response = self._request_test_document_tag_remove_api_view()
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        self.assertTrue(self.test_tag in self.test_document.tags.all())
+        self.assertTrue(self._test_document_has_tag())
 
         events = self._get_test_events()
         self.assertEqual(events.count(), 0)
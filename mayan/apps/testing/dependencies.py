@@ -22,6 +22,10 @@ PythonDependency(
     environment=environment_testing, module=__name__,
     name='django-test-migrations', version_string='==0.2.0'
 )
+PythonDependency(
+    environment=environment_testing, module=__name__, name='nplusone',
+    version_string='==1.0.0'
+)
 # Mock is set to production so that it is available in the Docker image
 # and allows running the test suit in production.
 PythonDependency(
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 import glob
 import importlib
 import logging
@@ -6,6 +7,7 @@ import random
 import time
 
 from furl import furl
+from nplusone.core.profiler import Profiler
 from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.firefox.webdriver import WebDriver
 
@@ -217,6 +219,36 @@ class ModelTestCaseMixin:
         ).values()[0]
 
 
+class NPlusOneCheckTestCaseMixin:
+    """
+    Execute each test client request inside the nplusone profiler. The
+    request will fail with an NPlusOneError if a related object is lazy
+    loaded for each row of a queryset (N+1 queries) or if an eager loaded
+    relationship is not used. Only the requests are profiled, instances
+    loaded by the test fixtures are not tracked.
+    """
+    _nplusone_check_enable = True
+
+    def _pre_setup(self):
+        super()._pre_setup()
+        test_instance = self
+
+        class NPlusOneCheckClient(self.client.__class__):
+            def request(self, *args, **kwargs):
+                with test_instance._nplusone_check():
+                    return super().request(*args, **kwargs)
+
+        self.client = NPlusOneCheckClient()
+
+    @contextmanager
+    def _nplusone_check(self):
+        if self._nplusone_check_enable:
+            with Profiler():
+                yield
+        else:
+            yield
+
+
 class OpenFileCheckTestCaseMixin:
     def _get_descriptor_count(self):
         process = psutil.Process()
@@ -0,0 +1,47 @@
+from nplusone.core.exceptions import NPlusOneError
+
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+
+from .base import BaseTestCase
+from .mixins import NPlusOneCheckTestCaseMixin
+
+
+class NPlusOneCheckTestCaseMixinTestCase(
+    NPlusOneCheckTestCaseMixin, BaseTestCase
+):
+    def setUp(self):
+        super().setUp()
+        content_type = ContentType.objects.get_for_model(model=Permission)
+
+        self.test_permission_pk_list = [
+            Permission.objects.create(
+                codename='test_{}'.format(index), content_type=content_type,
+                name='test {}'.format(index)
+            ).pk for index in range(2)
+        ]
+
+    def _load_test_permission_content_types(self, queryset):
+        for permission in queryset.filter(pk__in=self.test_permission_pk_list):
+            permission.content_type
+
+    def test_eager_load(self):
+        with self._nplusone_check():
+            self._load_test_permission_content_types(
+                queryset=Permission.objects.select_related('content_type')
+            )
+
+    def test_lazy_load(self):
+        with self.assertRaises(expected_exception=NPlusOneError):
+            with self._nplusone_check():
+                self._load_test_permission_content_types(
+                    queryset=Permission.objects.all()
+                )
+
+    def test_lazy_load_check_disabled(self):
+        self._nplusone_check_enable = False
+
+        with self._nplusone_check():
+            self._load_test_permission_content_types(
+                queryset=Permission.objects.all()
+            )
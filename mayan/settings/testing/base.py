@@ -11,6 +11,8 @@ FILE_METADATA_AUTO_PROCESS = False
 INSTALLED_APPS = [
     cls for cls in INSTALLED_APPS if cls != 'whitenoise.runserver_nostatic'
 ]
+# Patch the ORM to allow detecting N+1 queries during tests.
+INSTALLED_APPS.append('nplusone.ext.django')
 
 LOGGING_LOG_FILE_PATH = '/tmp/mayan-errors.log'
 LOGGING_LEVEL = 'WARNING'